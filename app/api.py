@@ -2,18 +2,60 @@
 FastAPI endpoint for the AI Hallucination Meter.
 Useful for Chrome extension or API integration.
 """
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import Any, Dict, Optional
 import os
 from core.hallucination_meter import HallucinationMeter
+from core.retrieval import shutdown as shutdown_retrieval
+
+
+# Size of the dedicated pool for the blocking evaluation pipeline, so concurrency
+# is bounded independently of AnyIO's default worker-thread limit
+API_WORKERS = 32
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """
+    Start the API thread pool and warm up the default meter so the first
+    request doesn't pay for client and TLS setup; release both on shutdown.
+    """
+    # A fresh pool per app run: the loop shuts its default executor down on close
+    executor = ThreadPoolExecutor(max_workers=API_WORKERS, thread_name_prefix="truthlens-api")
+    app.state.executor = executor
+    # asyncio.to_thread() inside the async pipeline (/query) then shares the
+    # same bounded pool as the blocking /check pipeline
+    asyncio.get_running_loop().set_default_executor(executor)
+    try:
+        meter = await _run_blocking(_get_meter, "openai", "wikipedia", True)
+        # /check runs on the sync client, /query on the async one
+        await _run_blocking(meter.llm.generate, "ping", "Reply with ok.")
+        await meter.llm.generate_async("ping", system_prompt="Reply with ok.")
+    except Exception as e:
+        print(f"Warm-up skipped: {e}")
+    
+    try:
+        yield
+    finally:
+        # Stop the shared retrieval loop and close its pooled connections
+        await _run_blocking(shutdown_retrieval)
+        app.state.executor = None
+        executor.shutdown(wait=False)
 
 
 app = FastAPI(
     title="TruthLens AI API",
     description="API for evaluating LLM output for hallucinations",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=_lifespan
 )
 
 # Enable CORS for Chrome extension
@@ -42,6 +84,43 @@ class QueryEvaluationRequest(BaseModel):
     use_llm_verification: Optional[bool] = True
 
 
+class EvaluationResponse(BaseModel):
+    """Response envelope for /check and /query (documentation only, not validated)."""
+    success: bool
+    result: Dict[str, Any]
+
+
+@lru_cache(maxsize=8)
+def _get_meter(llm_provider: str, retrieval_method: str, use_llm_verification: bool) -> HallucinationMeter:
+    """Return a process-wide meter so LLM/HTTP clients and their connection pools are reused."""
+    return HallucinationMeter(
+        llm_provider=llm_provider,
+        retrieval_method=retrieval_method,
+        use_llm_verification=use_llm_verification
+    )
+
+
+async def _meter_for(request) -> HallucinationMeter:
+    """
+    Return the shared meter for a request's settings. Names are normalized so
+    e.g. "OpenAI" and "openai" share one meter, and a cache miss (which builds
+    SDK clients and the disk cache) runs off the event loop.
+    """
+    return await _run_blocking(
+        _get_meter,
+        (request.llm_provider or "openai").lower(),
+        (request.retrieval_method or "wikipedia").lower(),
+        bool(request.use_llm_verification)
+    )
+
+
+async def _run_blocking(func, *args):
+    """Run a blocking call on the API thread pool without stalling the event loop."""
+    loop = asyncio.get_running_loop()
+    # Outside the lifespan (no app pool yet) this falls back to the loop's default executor
+    return await loop.run_in_executor(getattr(app.state, "executor", None), func, *args)
+
+
 @app.get("/")
 def root():
     """Root endpoint."""
@@ -62,8 +141,8 @@ def health():
     return {"status": "healthy"}
 
 
-@app.post("/check")
-def check_hallucination(request: TextEvaluationRequest):
+@app.post("/check", responses={200: {"model": EvaluationResponse}})
+async def check_hallucination(request: TextEvaluationRequest):
     """
     Evaluate text for hallucinations.
     
@@ -78,25 +157,23 @@ def check_hallucination(request: TextEvaluationRequest):
     ```
     """
     try:
-        meter = HallucinationMeter(
-            llm_provider=request.llm_provider,
-            retrieval_method=request.retrieval_method,
-            use_llm_verification=request.use_llm_verification
-        )
+        meter = await _meter_for(request)
         
-        result = meter.evaluate(request.text)
+        result = await _run_blocking(meter.evaluate, request.text)
         
-        return {
+        # Return the response directly so FastAPI skips jsonable_encoder on the
+        # (potentially large) claim_results payload
+        return ORJSONResponse({
             "success": True,
             "result": result
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/query")
-def query_and_evaluate(request: QueryEvaluationRequest):
+@app.post("/query", responses={200: {"model": EvaluationResponse}})
+async def query_and_evaluate(request: QueryEvaluationRequest):
     """
     Generate answer to query and evaluate it.
     
@@ -111,18 +188,16 @@ def query_and_evaluate(request: QueryEvaluationRequest):
     ```
     """
     try:
-        meter = HallucinationMeter(
-            llm_provider=request.llm_provider,
-            retrieval_method=request.retrieval_method,
-            use_llm_verification=request.use_llm_verification
-        )
+        meter = await _meter_for(request)
         
-        result = meter.evaluate_query(request.query)
+        result = await meter.evaluate_query_async(request.query)
         
-        return {
+        # Return the response directly so FastAPI skips jsonable_encoder on the
+        # (potentially large) claim_results payload
+        return ORJSONResponse({
             "success": True,
             "result": result
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -130,5 +205,6 @@ def query_and_evaluate(request: QueryEvaluationRequest):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # "auto" picks uvloop where it is installed (not on Windows) and asyncio elsewhere
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="httptools")
 
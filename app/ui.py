@@ -7,6 +7,26 @@ from core.hallucination_meter import HallucinationMeter
 from core.utils import format_score_display, format_verdict, get_verdict_color
 
 
+@st.cache_resource(max_entries=8)
+def _get_meter(
+    llm_provider: str,
+    retrieval_method: str,
+    use_llm_verification: bool,
+    api_key: str
+) -> HallucinationMeter:
+    """
+    Return a cached meter so LLM/HTTP clients are reused across reruns.
+    
+    api_key is only part of the cache key, so entering a new key in the
+    sidebar builds a fresh meter instead of reusing stale clients.
+    """
+    return HallucinationMeter(
+        llm_provider=llm_provider,
+        retrieval_method=retrieval_method,
+        use_llm_verification=use_llm_verification
+    )
+
+
 def main():
     """Main Streamlit app."""
     st.set_page_config(
@@ -81,10 +101,11 @@ def main():
             else:
                 try:
                     with st.spinner("Analyzing text for hallucinations..."):
-                        meter = HallucinationMeter(
-                            llm_provider=llm_provider,
-                            retrieval_method=retrieval_method,
-                            use_llm_verification=use_llm_verification
+                        meter = _get_meter(
+                            llm_provider,
+                            retrieval_method,
+                            use_llm_verification,
+                            api_key
                         )
                         result = meter.evaluate(text_input)
                     
@@ -110,10 +131,11 @@ def main():
             else:
                 try:
                     with st.spinner("Generating answer and checking for hallucinations..."):
-                        meter = HallucinationMeter(
-                            llm_provider=llm_provider,
-                            retrieval_method=retrieval_method,
-                            use_llm_verification=use_llm_verification
+                        meter = _get_meter(
+                            llm_provider,
+                            retrieval_method,
+                            use_llm_verification,
+                            api_key
                         )
                         result = meter.evaluate_query(query)
                     
@@ -1,19 +1,33 @@
 """
 Core modules for AI Hallucination Meter.
+
+Exports are imported lazily, so importing one submodule (e.g. core.retrieval)
+does not load the LLM provider SDKs.
 """
-from .llm import LLMWrapper
-from .retrieval import EvidenceRetriever
-from .fact_extract import ClaimExtractor
-from .evaluator import TruthfulnessEvaluator
-from .utils import format_score_display, format_verdict, get_verdict_color
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "LLMWrapper": ".llm",
+    "EvidenceRetriever": ".retrieval",
+    "ClaimExtractor": ".fact_extract",
+    "TruthfulnessEvaluator": ".evaluator",
+    "format_score_display": ".utils",
+    "format_scores_display": ".utils",
+    "format_verdict": ".utils",
+    "get_verdict_color": ".utils"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
 
-__all__ = [
-    "LLMWrapper",
-    "EvidenceRetriever",
-    "ClaimExtractor",
-    "TruthfulnessEvaluator",
-    "format_score_display",
-    "format_verdict",
-    "get_verdict_color"
-]
 
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,197 @@
+"""
+Caches shared by the pipeline components (in-process and on-disk).
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from typing import Any, Dict, Hashable, Iterable, Optional
+import numpy as np
+import orjson
+
+
+def content_key(*parts: Any) -> str:
+    """
+    Build a stable content-addressed cache key.
+
+    Args:
+        parts: JSON-serializable values identifying the cached content
+
+    Returns:
+        SHA-256 hex digest of the parts
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """Thread-safe LRU cache with an optional time-to-live per entry."""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently used is evicted
+            ttl: Seconds an entry stays valid (None means entries never expire)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache: a lookup hits when a stored vector is close enough
+    (by cosine similarity) to the query vector.
+    """
+
+    def __init__(self, threshold: float = 0.92, maxsize: int = 1024, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            maxsize: Maximum number of entries before the oldest is evicted
+            ttl: Seconds an entry stays valid (None means entries never expire)
+        """
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._vectors: Optional[np.ndarray] = None
+        self._values: list = []
+        self._expires: list = []
+        self._lock = threading.Lock()
+
+    def get(self, vector: np.ndarray, default: Any = None) -> Any:
+        """Return the value stored for the most similar vector, or default if none is close enough."""
+        query = self._normalize(vector)
+        with self._lock:
+            if not self._values:
+                return default
+
+            similarities = self._vectors @ query
+            if self.ttl is not None:
+                similarities[np.asarray(self._expires) <= time.monotonic()] = -np.inf
+
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                return self._values[best]
+            return default
+
+    def set(self, vector: np.ndarray, value: Any) -> None:
+        """Store value under vector, evicting the oldest entry if full."""
+        row = self._normalize(vector)[np.newaxis, :]
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else np.inf
+        with self._lock:
+            vectors = row if self._vectors is None else np.vstack([self._vectors, row])
+            self._vectors = vectors[-self.maxsize:]
+            self._values = (self._values + [value])[-self.maxsize:]
+            self._expires = (self._expires + [expires_at])[-self.maxsize:]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._values)
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+
+class DiskCache:
+    """SQLite-backed key/value cache with a time-to-live, persisted across runs."""
+
+    def __init__(self, path: str, ttl: float):
+        """
+        Initialize the cache, creating the database file if needed.
+
+        Args:
+            path: Location of the SQLite database
+            ttl: Seconds an entry stays valid
+        """
+        self.path = path
+        self.ttl = ttl
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, ts REAL NOT NULL)"
+        )
+        self._execute("CREATE INDEX IF NOT EXISTS cache_ts ON cache (ts)")
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return the unexpired values stored for keys (missing keys are omitted)."""
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        placeholders = ",".join("?" * len(keys))
+        rows = self._execute(
+            f"SELECT key, value FROM cache WHERE key IN ({placeholders}) AND ts > ?",
+            (*keys, time.time() - self.ttl)
+        )
+        return {key: orjson.loads(value) for key, value in rows}
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Store JSON-serializable values, replacing existing entries and dropping expired ones."""
+        if not items:
+            return
+
+        now = time.time()
+        self._execute(
+            "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+            [(key, orjson.dumps(value).decode("utf-8"), now) for key, value in items.items()],
+            many=True
+        )
+        # Keys embed the claim text, so without pruning the file would grow forever
+        self._execute("DELETE FROM cache WHERE ts <= ?", (now - self.ttl,))
+
+    def _execute(self, sql: str, params=(), many: bool = False) -> list:
+        """Run one statement in its own connection; storage errors degrade to a cache miss."""
+        try:
+            with closing(sqlite3.connect(self.path, timeout=5)) as conn:
+                with conn:
+                    cursor = conn.executemany(sql, params) if many else conn.execute(sql, params)
+                    return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Disk cache error: {e}")
+            return []
@@ -1,13 +1,39 @@
 """
 Evaluator module - compares claims against evidence and calculates truthfulness scores.
 """
-import json
-import numpy as np
+import asyncio
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 from typing import List, Dict, Optional
 from .retrieval import EvidenceRetriever
 from .llm import LLMWrapper
 
 
+# Upper bound on concurrent verification calls, to stay within provider rate limits
+MAX_CONCURRENT_VERIFICATIONS = 8
+
+# Score cut-offs shared by the claim and overall verdict ladders (lowest first)
+_SCORE_THRESHOLDS = (0.35, 0.55, 0.75)
+_CLAIM_VERDICTS = ("contradicted", "weak_support", "uncertain", "supported")
+_OVERALL_VERDICTS = ("likely_hallucination", "uncertain", "mostly_truthful", "highly_truthful")
+
+_VERIFY_SYSTEM_PROMPT = "You are a fact-checking system. Be precise and objective."
+
+# Static instructions come first so providers can cache the shared prompt prefix
+_VERIFY_PREFIX = """Evaluate whether the claim below is supported by the provided evidence.
+
+Respond with a JSON object containing:
+- "supported": true/false (is the claim supported by evidence?)
+- "confidence": 0.0-1.0 (how confident are you?)
+- "reasoning": brief explanation
+- "contradiction": true/false (does evidence contradict the claim?)
+
+Return ONLY the JSON object, no other text.
+
+"""
+
+
 class TruthfulnessEvaluator:
     """Evaluates truthfulness of claims by comparing against evidence."""
     
@@ -48,126 +74,158 @@ class TruthfulnessEvaluator:
             # Method 2: Use embedding similarity
             return self._evaluate_with_embeddings(claim, evidence)
     
+    async def evaluate_claim_async(
+        self,
+        claim: str,
+        evidence: List[Dict[str, str]],
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, any]:
+        """
+        Async variant of evaluate_claim().
+        
+        Args:
+            claim: The claim to evaluate
+            evidence: List of evidence dictionaries
+            semaphore: Bounds the number of in-flight LLM calls
+            
+        Returns:
+            Dictionary with score, verdict, and reasoning
+        """
+        if not evidence:
+            return self.evaluate_claim(claim, evidence)
+        
+        if self.llm:
+            return await self._evaluate_with_llm_async(claim, evidence, semaphore)
+        else:
+            return await asyncio.to_thread(self._evaluate_with_embeddings, claim, evidence)
+    
     def _evaluate_with_llm(self, claim: str, evidence: List[Dict[str, str]]) -> Dict[str, any]:
         """Evaluate using LLM verification."""
-        evidence_text = "\n\n".join([
-            f"Source: {ev['source']}\n{ev['text']}"
-            for ev in evidence[:3]  # Use top 3 evidence snippets
-        ])
-        
-        prompt = f"""Evaluate whether the following claim is supported by the provided evidence.
-
-Claim: {claim}
-
-Evidence:
-{evidence_text}
-
-Respond with a JSON object containing:
-- "supported": true/false (is the claim supported by evidence?)
-- "confidence": 0.0-1.0 (how confident are you?)
-- "reasoning": brief explanation
-- "contradiction": true/false (does evidence contradict the claim?)
-
-Return ONLY the JSON object, no other text."""
-
         try:
-            response = self.llm.generate(
-                prompt,
-                system_prompt="You are a fact-checking system. Be precise and objective."
-            )
-            
-            # Parse JSON response
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response[7:]
-            if response.startswith("```"):
-                response = response[3:]
-            if response.endswith("```"):
-                response = response[:-3]
-            response = response.strip()
-            
-            result = json.loads(response)
+            return self._parse_verification(self._verify(claim, evidence))
             
-            supported = result.get("supported", False)
-            confidence = float(result.get("confidence", 0.5))
-            contradiction = result.get("contradiction", False)
+        except ValueError as e:
+            print(f"LLM evaluation error: {e}")
+            # Unusable answer: fall back to embedding method
+            return self._evaluate_with_embeddings(claim, evidence)
             
-            # Calculate score
-            if contradiction:
-                score = 0.0
-                verdict = "contradicted"
-            elif supported:
-                score = confidence
-                verdict = "supported"
-            else:
-                score = 0.3  # Uncertain
-                verdict = "uncertain"
+        except Exception as e:
+            print(f"LLM evaluation error: {e}")
+            return self._error_result(e)
+    
+    async def _evaluate_with_llm_async(
+        self,
+        claim: str,
+        evidence: List[Dict[str, str]],
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, any]:
+        """Evaluate using LLM verification without blocking the event loop."""
+        try:
+            async with semaphore:
+                response = await self._verify_async(claim, evidence)
+            return self._parse_verification(response)
             
-            return {
-                "score": score,
-                "verdict": verdict,
-                "reasoning": result.get("reasoning", ""),
-                "confidence": confidence
-            }
+        except ValueError as e:
+            print(f"LLM evaluation error: {e}")
+            # Unusable answer: fall back to embedding method
+            return await asyncio.to_thread(self._evaluate_with_embeddings, claim, evidence)
             
         except Exception as e:
             print(f"LLM evaluation error: {e}")
-            # Fallback to embedding method
-            return self._evaluate_with_embeddings(claim, evidence)
+            return self._error_result(e)
+    
+    def _verify(self, claim: str, evidence: List[Dict[str, str]]) -> str:
+        """Ask the LLM for a JSON verdict on the claim."""
+        return self.llm.generate(
+            self._build_verification_prompt(claim, evidence),
+            system_prompt=_VERIFY_SYSTEM_PROMPT,
+            cacheable=True,
+            json_mode=True,
+            prompt_cache_key="truthlens-verify-v1"
+        )
+    
+    async def _verify_async(self, claim: str, evidence: List[Dict[str, str]]) -> str:
+        """Async variant of _verify()."""
+        return await self.llm.generate_async(
+            self._build_verification_prompt(claim, evidence),
+            system_prompt=_VERIFY_SYSTEM_PROMPT,
+            cacheable=True,
+            json_mode=True,
+            prompt_cache_key="truthlens-verify-v1"
+        )
+    
+    def _build_verification_prompt(self, claim: str, evidence: List[Dict[str, str]]) -> str:
+        """Build the LLM verification prompt for a claim."""
+        evidence_text = "\n\n".join([
+            f"Source: {ev['source']}\n{ev['text']}"
+            for ev in evidence[:3]  # Use top 3 evidence snippets
+        ])
+        
+        return f"{_VERIFY_PREFIX}Claim: {claim}\n\nEvidence:\n{evidence_text}"
+    
+    def _parse_verification(self, response: str) -> Dict[str, any]:
+        """Turn the LLM's JSON verdict into a scored result."""
+        result = orjson.loads(response)
+        if not isinstance(result, dict):
+            raise ValueError(f"Expected a JSON object, got {type(result).__name__}")
+        
+        supported = result.get("supported", False)
+        confidence = float(result.get("confidence", 0.5))
+        contradiction = result.get("contradiction", False)
+        
+        # Calculate score
+        if contradiction:
+            score = 0.0
+            verdict = "contradicted"
+        elif supported:
+            score = confidence
+            verdict = "supported"
+        else:
+            score = 0.3  # Uncertain
+            verdict = "uncertain"
+        
+        return {
+            "score": score,
+            "verdict": verdict,
+            "reasoning": result.get("reasoning", ""),
+            "confidence": confidence
+        }
     
     def _evaluate_with_embeddings(self, claim: str, evidence: List[Dict[str, str]]) -> Dict[str, any]:
         """Evaluate using embedding similarity."""
         try:
-            claim_embedding = np.array(self.retriever.get_embeddings(claim))
+            # Embed the claim and all evidence in a single request
+            vectors = self.retriever.get_embeddings_batch([claim] + [ev['text'] for ev in evidence])
+            claim_embedding, ev_embeddings = vectors[0], vectors[1:]
             
-            similarities = []
-            for ev in evidence:
-                ev_embedding = np.array(self.retriever.get_embeddings(ev['text']))
-                similarity = self._cosine_similarity(claim_embedding, ev_embedding)
-                similarities.append(similarity)
+            # Embeddings are unit vectors: cosine similarity is one matmul
+            similarities = ev_embeddings @ claim_embedding
             
-            avg_similarity = np.mean(similarities) if similarities else 0.0
-            max_similarity = max(similarities) if similarities else 0.0
+            avg_similarity = similarities.mean() if similarities.size else 0.0
+            max_similarity = similarities.max() if similarities.size else 0.0
             
             # Weighted score: 70% max similarity, 30% average
             score = 0.7 * max_similarity + 0.3 * avg_similarity
             
-            # Determine verdict
-            if score >= 0.75:
-                verdict = "supported"
-            elif score >= 0.55:
-                verdict = "uncertain"
-            elif score >= 0.35:
-                verdict = "weak_support"
-            else:
-                verdict = "contradicted"
-            
             return {
                 "score": float(score),
-                "verdict": verdict,
+                "verdict": _CLAIM_VERDICTS[bisect_right(_SCORE_THRESHOLDS, score)],
                 "reasoning": f"Embedding similarity: {score:.2f}",
                 "confidence": float(max_similarity)
             }
             
         except Exception as e:
             print(f"Embedding evaluation error: {e}")
-            return {
-                "score": 0.0,
-                "verdict": "error",
-                "reasoning": f"Evaluation error: {str(e)}",
-                "confidence": 0.0
-            }
+            return self._error_result(e)
     
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors."""
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
-        
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        
-        return dot_product / (norm1 * norm2)
+    def _error_result(self, error: Exception) -> Dict[str, any]:
+        """Result for a claim that could not be evaluated."""
+        return {
+            "score": 0.0,
+            "verdict": "error",
+            "reasoning": f"Evaluation error: {str(error)}",
+            "confidence": 0.0
+        }
     
     def evaluate_text(self, claims: List[Dict[str, str]], evidence_list: List[List[Dict[str, str]]]) -> Dict[str, any]:
         """
@@ -188,35 +246,58 @@ Return ONLY the JSON object, no other text."""
                 "total_claims": 0
             }
         
+        claim_texts = [claim_dict.get("claim", "") for claim_dict in claims]
+        
+        # Claims are verified independently, so run the (network-bound) checks concurrently
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_VERIFICATIONS) as executor:
+            results = list(executor.map(self.evaluate_claim, claim_texts, evidence_list))
+        
+        return self._aggregate(claims, results)
+    
+    async def evaluate_text_async(
+        self,
+        claims: List[Dict[str, str]],
+        evidence_list: List[List[Dict[str, str]]]
+    ) -> Dict[str, any]:
+        """
+        Async variant of evaluate_text() that issues all verifications concurrently.
+        
+        Args:
+            claims: List of claim dictionaries
+            evidence_list: List of evidence lists (one per claim)
+            
+        Returns:
+            Overall evaluation result with aggregated score
+        """
+        if not claims:
+            return self.evaluate_text(claims, evidence_list)
+        
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_VERIFICATIONS)
+        results = await asyncio.gather(*(
+            self.evaluate_claim_async(claim_dict.get("claim", ""), evidence, semaphore)
+            for claim_dict, evidence in zip(claims, evidence_list)
+        ))
+        
+        return self._aggregate(claims, list(results))
+    
+    def _aggregate(self, claims: List[Dict[str, str]], results: List[Dict[str, any]]) -> Dict[str, any]:
+        """Attach claim metadata to per-claim results and compute the overall score."""
         claim_results = []
         scores = []
         
-        for claim_dict, evidence in zip(claims, evidence_list):
-            claim = claim_dict.get("claim", "")
-            result = self.evaluate_claim(claim, evidence)
-            result["claim"] = claim
+        for claim_dict, result in zip(claims, results):
+            result["claim"] = claim_dict.get("claim", "")
             result["context"] = claim_dict.get("context", "")
             claim_results.append(result)
             scores.append(result["score"])
         
         # Calculate overall score (weighted average)
-        overall_score = np.mean(scores) if scores else 0.0
-        
-        # Determine overall verdict
-        if overall_score >= 0.75:
-            verdict = "highly_truthful"
-        elif overall_score >= 0.55:
-            verdict = "mostly_truthful"
-        elif overall_score >= 0.35:
-            verdict = "uncertain"
-        else:
-            verdict = "likely_hallucination"
+        overall_score = sum(scores) / len(scores) if scores else 0.0
         
         return {
             "overall_score": float(overall_score),
-            "verdict": verdict,
+            "verdict": _OVERALL_VERDICTS[bisect_right(_SCORE_THRESHOLDS, overall_score)],
             "claim_results": claim_results,
             "total_claims": len(claims),
             "percentage_score": float(overall_score * 100)
         }
-
@@ -2,10 +2,102 @@
 Fact extraction module - extracts atomic claims from LLM output.
 """
 import json
-from typing import List, Dict
+import re
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+import orjson
 from .llm import LLMWrapper
 
 
+# Sentence terminators; a period followed by a digit is a decimal point, not a boundary
+_SENTENCE_BOUNDARY_RE = re.compile(r"[.!?](?!\d)")
+_DIGIT_RE = re.compile(r"\d")
+
+# Text just before the claims array opens
+_CLAIMS_KEY_RE = re.compile(r'"claims"\s*:\s*$')
+
+_EXTRACT_SYSTEM_PROMPT = "You are a precise fact extraction system. Extract only verifiable factual claims."
+
+# Static instructions come first so providers can cache the shared prompt prefix
+_EXTRACT_PREFIX = """Extract all atomic factual claims from the text at the end of this message.
+A factual claim is a statement that can be verified as true or false.
+
+For each claim, provide:
+1. The specific factual statement
+2. The context (what it refers to)
+
+Format your response as a JSON object with a "claims" array, where each item has:
+- "claim": the specific factual statement
+- "context": brief context about what this claim refers to
+
+Example format:
+{"claims": [
+  {"claim": "Beethoven met Mozart in Vienna", "context": "Historical meeting between composers"},
+  {"claim": "The meeting occurred in 1787", "context": "Year of the meeting"}
+]}
+
+Return ONLY the JSON object, no other text.
+
+Text to analyze:
+"""
+
+
+def _iter_array_items(chunks: Iterable[str], raw: List[str]) -> Iterator[object]:
+    """
+    Incrementally parse streamed JSON, yielding each element of the claims
+    array as soon as it is complete.
+    
+    Args:
+        chunks: Text fragments of a JSON document ({"claims": [...]} or a bare array)
+        raw: Receives every fragment, so the caller can inspect the full text
+        
+    Yields:
+        Decoded array elements
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = None
+    # Scanner state while looking for the array: brackets inside strings and
+    # arrays under other (or nested) keys must not be mistaken for it
+    scan = depth = 0
+    in_string = escaped = False
+    
+    for chunk in chunks:
+        raw.append(chunk)
+        buffer += chunk
+        
+        while pos is None and scan < len(buffer):
+            char = buffer[scan]
+            scan += 1
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "[" and (depth == 0 or (depth == 1 and _CLAIMS_KEY_RE.search(buffer, 0, scan - 1))):
+                pos = scan
+            elif char in "[{":
+                depth += 1
+            elif char in "]}":
+                depth -= 1
+        if pos is None:
+            continue
+        
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buffer) or buffer[pos] == "]":
+                break
+            try:
+                item, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # Element not complete yet
+            yield item
+
+
 class ClaimExtractor:
     """Extracts factual claims from text that can be fact-checked."""
     
@@ -18,89 +110,125 @@ class ClaimExtractor:
         """
         self.llm = llm_wrapper
     
-    def extract_claims(self, text: str) -> List[Dict[str, str]]:
+    def extract_claims(self, text: str, on_error: Optional[Callable[[], None]] = None) -> List[Dict[str, str]]:
         """
         Extract atomic factual claims from text.
         
         Args:
             text: Text to extract claims from
+            on_error: Called if LLM extraction fails and the fallback extractor is used
             
         Returns:
             List of claim dictionaries with 'claim' and 'context' keys
         """
-        prompt = f"""Extract all atomic factual claims from the following text. 
-A factual claim is a statement that can be verified as true or false.
-
-For each claim, provide:
-1. The specific factual statement
-2. The context (what it refers to)
-
-Text to analyze:
-{text}
-
-Format your response as a JSON array, where each item has:
-- "claim": the specific factual statement
-- "context": brief context about what this claim refers to
-
-Example format:
-[
-  {{"claim": "Beethoven met Mozart in Vienna", "context": "Historical meeting between composers"}},
-  {{"claim": "The meeting occurred in 1787", "context": "Year of the meeting"}}
-]
-
-Return ONLY the JSON array, no other text."""
-
         try:
             response = self.llm.generate(
-                prompt,
-                system_prompt="You are a precise fact extraction system. Extract only verifiable factual claims."
+                _EXTRACT_PREFIX + text,
+                system_prompt=_EXTRACT_SYSTEM_PROMPT,
+                cacheable=True,
+                json_mode=True,
+                prompt_cache_key="truthlens-extract-v1"
             )
             
-            # Try to parse JSON from response
-            # Sometimes LLM adds markdown formatting
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response[7:]
-            if response.startswith("```"):
-                response = response[3:]
-            if response.endswith("```"):
-                response = response[:-3]
-            response = response.strip()
-            
-            claims = json.loads(response)
-            
-            # Ensure format is correct
-            if isinstance(claims, list):
-                return [
-                    {
-                        "claim": item.get("claim", ""),
-                        "context": item.get("context", "")
-                    }
-                    for item in claims
-                    if item.get("claim")
-                ]
-            else:
-                return []
+            return self._parse_claims(response)
                 
         except Exception as e:
             print(f"Error extracting claims: {e}")
+            if on_error is not None:
+                on_error()
             # Fallback: simple sentence-based extraction
             return self._fallback_extract(text)
     
+    def extract_claims_stream(
+        self,
+        text: str,
+        on_error: Optional[Callable[[], None]] = None
+    ) -> Iterator[Dict[str, str]]:
+        """
+        Stream atomic factual claims from text as the LLM generates them.
+        
+        Lets callers start working on the first claims before extraction
+        has finished.
+        
+        Args:
+            text: Text to extract claims from
+            on_error: Called if LLM extraction fails, so the claims are partial
+                or come from the fallback extractor
+            
+        Yields:
+            Claim dictionaries with 'claim' and 'context' keys
+        """
+        emitted = []
+        raw = []
+        
+        try:
+            stream = self.llm.generate_stream(
+                _EXTRACT_PREFIX + text,
+                system_prompt=_EXTRACT_SYSTEM_PROMPT,
+                cacheable=True,
+                json_mode=True,
+                prompt_cache_key="truthlens-extract-v1"
+            )
+            for item in _iter_array_items(stream, raw):
+                claim = self._to_claim(item)
+                if claim:
+                    emitted.append(claim)
+                    yield claim
+            
+            # Reconcile with a full parse, so the result always matches
+            # extract_claims() on the same (cached) response; unparseable
+            # output raises and falls back the same way
+            pending = list(emitted)
+            for claim in self._parse_claims("".join(raw)):
+                if claim in pending:
+                    pending.remove(claim)
+                else:
+                    emitted.append(claim)
+                    yield claim
+                
+        except Exception as e:
+            print(f"Error extracting claims: {e}")
+            if on_error is not None:
+                on_error()
+            if not emitted:
+                # Fallback: simple sentence-based extraction
+                yield from self._fallback_extract(text)
+    
+    def _parse_claims(self, response: str) -> List[Dict[str, str]]:
+        """Parse a complete extraction response into normalized claims."""
+        claims = orjson.loads(response)
+        if isinstance(claims, dict):
+            claims = claims.get("claims", [])
+        
+        # Ensure format is correct
+        if isinstance(claims, list):
+            return [claim for claim in map(self._to_claim, claims) if claim]
+        else:
+            return []
+    
+    def _to_claim(self, item: object) -> Optional[Dict[str, str]]:
+        """Normalize one extracted item, dropping anything without a claim."""
+        if not isinstance(item, dict) or not item.get("claim"):
+            return None
+        return {
+            "claim": item.get("claim", ""),
+            "context": item.get("context", "")
+        }
+    
     def _fallback_extract(self, text: str) -> List[Dict[str, str]]:
         """Fallback extraction using simple sentence splitting."""
-        sentences = text.split('.')
         claims = []
         
-        for sentence in sentences:
+        for sentence in _SENTENCE_BOUNDARY_RE.split(text):
             sentence = sentence.strip()
-            if sentence and len(sentence) > 10:  # Filter very short sentences
+            if len(sentence) > 10:  # Filter very short sentences
                 # Simple heuristic: if sentence contains dates, names, or numbers
-                if any(char.isdigit() for char in sentence):
+                if _DIGIT_RE.search(sentence):
                     claims.append({
                         "claim": sentence,
                         "context": "Extracted from text"
                     })
+                    if len(claims) == 10:  # Limit to 10 claims
+                        break
         
-        return claims[:10]  # Limit to 10 claims
-
+        return claims
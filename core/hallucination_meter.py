@@ -2,11 +2,18 @@
 Main orchestrator for the AI Hallucination Meter.
 Combines all components to evaluate LLM output.
 """
-from typing import Dict, Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from .llm import LLMWrapper
 from .retrieval import EvidenceRetriever
 from .fact_extract import ClaimExtractor
 from .evaluator import TruthfulnessEvaluator
+from .cache import LRUCache, content_key
+
+
+# Claim verdicts that may come from transient failures, so results containing them aren't cached
+_UNCACHEABLE_VERDICTS = frozenset({"error", "no_evidence"})
 
 
 class HallucinationMeter:
@@ -34,6 +41,10 @@ class HallucinationMeter:
             self.retriever,
             llm_wrapper=self.llm if use_llm_verification else None
         )
+        # Full results for recently evaluated texts/queries (repeat submissions are common)
+        self._results = LRUCache(maxsize=512, ttl=3600)
+        # Strong references to fire-and-forget prefetch tasks
+        self._background = set()
     
     def evaluate(self, text: str) -> Dict:
         """
@@ -45,33 +56,149 @@ class HallucinationMeter:
         Returns:
             Dictionary with evaluation results
         """
-        # Step 1: Extract claims
-        claims = self.extractor.extract_claims(text)
+        return self._evaluate(text)[0]
+    
+    async def evaluate_async(self, text: str) -> Dict:
+        """
+        Async variant of evaluate() for callers already running an event loop.
+        
+        Args:
+            text: Text to evaluate (LLM output)
+            
+        Returns:
+            Dictionary with evaluation results
+        """
+        return (await self._evaluate_async(text))[0]
+    
+    def _evaluate(self, text: str) -> Tuple[Dict, bool]:
+        """evaluate(), also reporting whether claim extraction succeeded (the result is cacheable)."""
+        key = content_key("evaluate", text)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached, True
+        
+        # Steps 1-2: Extract claims, starting evidence retrieval for each
+        # claim as soon as it is streamed rather than after extraction ends
+        failures = []
+        claims = []
+        pending = []
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for claim_dict in self.extractor.extract_claims_stream(text, on_error=lambda: failures.append(True)):
+                claims.append(claim_dict)
+                pending.append(executor.submit(self._retrieve_for_claim, claim_dict))
+            evidence_list = [future.result() for future in pending]
         
         if not claims:
-            return {
-                "overall_score": 0.0,
-                "verdict": "no_claims",
-                "percentage_score": 0.0,
-                "claim_results": [],
-                "total_claims": 0,
-                "original_text": text
-            }
-        
-        # Step 2: Retrieve evidence for each claim
-        evidence_list = []
-        for claim_dict in claims:
-            claim = claim_dict.get("claim", "")
-            evidence = self.retriever.retrieve(claim, top_k=3)
-            evidence_list.append(evidence)
+            return self._remember(key, self._no_claims_result(text), not failures), not failures
         
         # Step 3: Evaluate claims against evidence
         result = self.evaluator.evaluate_text(claims, evidence_list)
         result["original_text"] = text
         result["claims"] = claims
         
+        return self._remember(key, result, not failures), not failures
+    
+    async def _evaluate_async(self, text: str) -> Tuple[Dict, bool]:
+        """Async variant of _evaluate()."""
+        key = content_key("evaluate", text)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached, True
+        
+        failures = []
+        claims = await asyncio.to_thread(
+            self.extractor.extract_claims,
+            text,
+            on_error=lambda: failures.append(True)
+        )
+        
+        if not claims:
+            return self._remember(key, self._no_claims_result(text), not failures), not failures
+        
+        evidence_list = await self._retrieve_for_claims_async(claims)
+        
+        result = await self.evaluator.evaluate_text_async(claims, evidence_list)
+        result["original_text"] = text
+        result["claims"] = claims
+        
+        return self._remember(key, result, not failures), not failures
+    
+    async def evaluate_query_async(self, query: str) -> Dict:
+        """
+        Async variant of evaluate_query().
+        
+        While the answer is being generated, claims are speculatively
+        extracted from the query itself and their evidence is fetched, so it
+        is already cached if the answer repeats them.
+        
+        Args:
+            query: User query
+            
+        Returns:
+            Dictionary with answer and evaluation results
+        """
+        key = content_key("query", query)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        
+        prefetch = asyncio.create_task(self._prefetch_evidence(query))
+        self._background.add(prefetch)
+        prefetch.add_done_callback(self._background.discard)
+        
+        answer = await self.llm.generate_answer_async(query)
+        
+        evaluation, cacheable = await self._evaluate_async(answer)
+        evaluation["query"] = query
+        evaluation["answer"] = answer
+        
+        return self._remember(key, evaluation, cacheable)
+    
+    async def _prefetch_evidence(self, text: str) -> None:
+        """Warm the retriever's cache with evidence for claims found in text."""
+        try:
+            claims = await asyncio.to_thread(self.extractor.extract_claims, text)
+            await self._retrieve_for_claims_async(claims)
+        except Exception as e:
+            print(f"Evidence prefetch error: {e}")
+    
+    async def _retrieve_for_claims_async(self, claims: List[Dict[str, str]]) -> List[List[Dict[str, str]]]:
+        """Retrieve evidence for all extracted claims concurrently."""
+        return await self.retriever.retrieve_many_async(
+            [claim_dict.get("claim", "") for claim_dict in claims],
+            top_k=3
+        )
+    
+    def _retrieve_for_claim(self, claim_dict: Dict[str, str]) -> List[Dict[str, str]]:
+        """Retrieve evidence for a single extracted claim."""
+        return self.retriever.retrieve(claim_dict.get("claim", ""), top_k=3)
+    
+    def _cached(self, key: str) -> Optional[Dict]:
+        """Return a copy of a cached result, so callers can annotate it freely."""
+        cached = self._results.get(key)
+        return dict(cached) if cached is not None else None
+    
+    def _remember(self, key: str, result: Dict, cacheable: bool = True) -> Dict:
+        """
+        Cache a result unless claim extraction failed (cacheable is False), or
+        some claim failed to evaluate or found no evidence (a lookup failure
+        looks the same as missing evidence). Those are all worth retrying.
+        """
+        if cacheable and not any(r.get("verdict") in _UNCACHEABLE_VERDICTS for r in result.get("claim_results", [])):
+            self._results.set(key, dict(result))
         return result
     
+    def _no_claims_result(self, text: str) -> Dict:
+        """Result returned when no verifiable claims were extracted."""
+        return {
+            "overall_score": 0.0,
+            "verdict": "no_claims",
+            "percentage_score": 0.0,
+            "claim_results": [],
+            "total_claims": 0,
+            "original_text": text
+        }
+    
     def evaluate_query(self, query: str) -> Dict:
         """
         Generate answer to query and evaluate it.
@@ -82,13 +209,18 @@ class HallucinationMeter:
         Returns:
             Dictionary with answer and evaluation results
         """
+        key = content_key("query", query)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        
         # Generate answer
         answer = self.llm.generate_answer(query)
         
         # Evaluate the answer
-        evaluation = self.evaluate(answer)
+        evaluation, cacheable = self._evaluate(answer)
         evaluation["query"] = query
         evaluation["answer"] = answer
         
-        return evaluation
+        return self._remember(key, evaluation, cacheable)
 
@@ -2,9 +2,31 @@
 LLM wrapper for generating and processing text with various providers.
 """
 import os
-from typing import Optional
-from openai import OpenAI
+from typing import Iterator, Optional
+import httpx
+from openai import OpenAI, AsyncOpenAI
 import anthropic
+from .cache import LRUCache, content_key
+
+
+# Responses to deterministic (temperature 0) prompts, shared by all wrappers
+_RESPONSE_CACHE = LRUCache(maxsize=1024, ttl=3600)
+
+# Keep-alive pool sized for the concurrent verification calls
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60)
+
+# The SDKs' own retry (which honors Retry-After) is the only retry layer on LLM calls
+_MAX_RETRIES = 1
+
+
+def _http_client() -> httpx.Client:
+    """HTTP/2 client with a persistent connection pool for the provider SDKs."""
+    return httpx.Client(transport=httpx.HTTPTransport(http2=True, limits=_HTTP_LIMITS))
+
+
+def _async_http_client() -> httpx.AsyncClient:
+    """Async counterpart of _http_client()."""
+    return httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(http2=True, limits=_HTTP_LIMITS))
 
 
 class LLMWrapper:
@@ -19,57 +41,251 @@ class LLMWrapper:
             api_key: API key (if None, reads from environment)
         """
         self.provider = provider.lower()
+        self._async_client = None
         
         if self.provider == "openai":
             api_key = api_key or os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY not found in environment")
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=api_key, max_retries=_MAX_RETRIES, http_client=_http_client())
+            self._api_key = api_key
             self.model = "gpt-4o-mini"  # Cost-effective default
             
         elif self.provider == "anthropic":
             api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
             if not api_key:
                 raise ValueError("ANTHROPIC_API_KEY not found in environment")
-            self.client = anthropic.Anthropic(api_key=api_key)
+            self.client = anthropic.Anthropic(
+                api_key=api_key,
+                max_retries=_MAX_RETRIES,
+                http_client=_http_client()
+            )
+            self._api_key = api_key
             self.model = "claude-3-haiku-20240307"  # Fast default
             
         else:
             raise ValueError(f"Unsupported provider: {provider}")
     
-    def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+    def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        cacheable: bool = False,
+        json_mode: bool = False,
+        prompt_cache_key: Optional[str] = None
+    ) -> str:
         """
         Generate text from a prompt.
         
         Args:
             prompt: User prompt
             system_prompt: Optional system prompt
+            cacheable: Run at temperature 0 and serve repeated prompts from cache
+            json_mode: Constrain the response to a single JSON object
+            prompt_cache_key: Routing hint for OpenAI prompt caching of a shared prefix
             
         Returns:
             Generated text
         """
+        if cacheable:
+            key = self._cache_key(prompt, system_prompt, json_mode)
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None:
+                return cached
+        
         if self.provider == "openai":
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-            
             response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.7
+                **self._openai_request(prompt, system_prompt, cacheable, json_mode, prompt_cache_key)
             )
-            return response.choices[0].message.content
             
         elif self.provider == "anthropic":
-            system = system_prompt or ""
             response = self.client.messages.create(
-                model=self.model,
-                max_tokens=1024,
-                system=system,
-                messages=[{"role": "user", "content": prompt}]
+                **self._anthropic_request(prompt, system_prompt, cacheable, json_mode)
+            )
+        
+        text = self._response_text(response, json_mode)
+        
+        if cacheable:
+            _RESPONSE_CACHE.set(key, text)
+        return text
+    
+    async def generate_async(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        cacheable: bool = False,
+        json_mode: bool = False,
+        prompt_cache_key: Optional[str] = None
+    ) -> str:
+        """
+        Async variant of generate() so many prompts can be in flight at once.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            cacheable: Run at temperature 0 and serve repeated prompts from cache
+            json_mode: Constrain the response to a single JSON object
+            prompt_cache_key: Routing hint for OpenAI prompt caching of a shared prefix
+            
+        Returns:
+            Generated text
+        """
+        if cacheable:
+            key = self._cache_key(prompt, system_prompt, json_mode)
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None:
+                return cached
+        
+        client = self._get_async_client()
+        
+        if self.provider == "openai":
+            response = await client.chat.completions.create(
+                **self._openai_request(prompt, system_prompt, cacheable, json_mode, prompt_cache_key)
+            )
+            
+        elif self.provider == "anthropic":
+            response = await client.messages.create(
+                **self._anthropic_request(prompt, system_prompt, cacheable, json_mode)
             )
-            return response.content[0].text
+        
+        text = self._response_text(response, json_mode)
+        
+        if cacheable:
+            _RESPONSE_CACHE.set(key, text)
+        return text
+    
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        cacheable: bool = False,
+        json_mode: bool = False,
+        prompt_cache_key: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream generated text as it arrives, so callers can act on partial output.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            cacheable: Run at temperature 0 and serve repeated prompts from cache
+            json_mode: Constrain the response to a single JSON object
+            prompt_cache_key: Routing hint for OpenAI prompt caching of a shared prefix
+            
+        Yields:
+            Text fragments in generation order
+        """
+        if cacheable:
+            key = self._cache_key(prompt, system_prompt, json_mode)
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None:
+                yield cached
+                return
+        
+        parts = []
+        if self.provider == "openai":
+            stream = self.client.chat.completions.create(
+                **self._openai_request(prompt, system_prompt, cacheable, json_mode, prompt_cache_key),
+                stream=True
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                    yield parts[-1]
+            
+        elif self.provider == "anthropic":
+            if json_mode:
+                # Matches the "{" prefilled in the assistant turn
+                parts.append("{")
+                yield "{"
+            with self.client.messages.stream(
+                **self._anthropic_request(prompt, system_prompt, cacheable, json_mode)
+            ) as stream:
+                for text in stream.text_stream:
+                    parts.append(text)
+                    yield text
+        
+        if cacheable:
+            _RESPONSE_CACHE.set(key, "".join(parts))
+    
+    def _get_async_client(self):
+        """Lazily create the async client (only needed by the async code paths)."""
+        if self._async_client is None:
+            if self.provider == "openai":
+                self._async_client = AsyncOpenAI(
+                    api_key=self._api_key,
+                    max_retries=_MAX_RETRIES,
+                    http_client=_async_http_client()
+                )
+            else:
+                self._async_client = anthropic.AsyncAnthropic(
+                    api_key=self._api_key,
+                    max_retries=_MAX_RETRIES,
+                    http_client=_async_http_client()
+                )
+        return self._async_client
+    
+    def _cache_key(self, prompt: str, system_prompt: Optional[str], json_mode: bool) -> str:
+        """Cache key identifying a prompt for this provider and model."""
+        return content_key(self.provider, self.model, system_prompt, prompt, json_mode)
+    
+    def _response_text(self, response, json_mode: bool) -> str:
+        """Extract the generated text from a provider response."""
+        if self.provider == "openai":
+            return response.choices[0].message.content
+        
+        text = response.content[0].text
+        # In JSON mode the opening brace was prefilled in the assistant turn
+        return "{" + text if json_mode else text
+    
+    def _openai_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        cacheable: bool,
+        json_mode: bool,
+        prompt_cache_key: Optional[str]
+    ) -> dict:
+        """Build chat completion arguments for OpenAI."""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        request = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": 0.0 if cacheable else 0.7
+        }
+        if json_mode:
+            request["response_format"] = {"type": "json_object"}
+        if prompt_cache_key:
+            # Sent via extra_body so older SDK versions pass it through unchanged
+            request["extra_body"] = {"prompt_cache_key": prompt_cache_key}
+        return request
+    
+    def _anthropic_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        cacheable: bool,
+        json_mode: bool
+    ) -> dict:
+        """Build message arguments for Anthropic."""
+        messages = [{"role": "user", "content": prompt}]
+        if json_mode:
+            # Prefill the reply so Claude continues a bare JSON object
+            messages.append({"role": "assistant", "content": "{"})
+        
+        request = {
+            "model": self.model,
+            "max_tokens": 1024,
+            "system": system_prompt or "",
+            "messages": messages
+        }
+        if cacheable:
+            request["temperature"] = 0.0
+        return request
     
     def generate_answer(self, query: str) -> str:
         """
@@ -82,4 +298,15 @@ class LLMWrapper:
             Answer text
         """
         return self.generate(query)
-
+    
+    async def generate_answer_async(self, query: str) -> str:
+        """
+        Async variant of generate_answer().
+        
+        Args:
+            query: User question
+            
+        Returns:
+            Answer text
+        """
+        return await self.generate_async(query)
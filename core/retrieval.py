@@ -2,36 +2,177 @@
 Retrieval module for fetching evidence from external sources.
 Supports Wikipedia, web search, and vector database search.
 """
+import asyncio
+import base64
 import os
-import requests
-from typing import List, Dict, Optional
-import wikipedia
-from openai import OpenAI
+import re
+import threading
+from typing import List, Dict, Optional, Tuple, Union
+from aiolimiter import AsyncLimiter
+import httpx
+import numpy as np
+import orjson
+from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+from .cache import DiskCache, LRUCache, SemanticCache, content_key
+
+
+WIKIPEDIA_API_URL = "https://{lang}.wikipedia.org/w/api.php"
+
+# Upper bound on concurrent lookups, to respect Wikipedia's soft limits
+MAX_CONCURRENT_RETRIEVALS = 8
+
+# Token bucket for MediaWiki calls: bursts of up to 50, averaging 50 per second
+WIKIPEDIA_MAX_RATE = 50
+WIKIPEDIA_RATE_PERIOD = 1.0
+
+# Sentences of each page intro kept as evidence
+EXTRACT_SENTENCES = 10
+_PERIOD_RE = re.compile(r"\.")
+
+# Wikimedia asks API clients to identify themselves
+HTTP_HEADERS = {"User-Agent": "TruthLensAI/1.0 (https://github.com/yksanjo/truthlens-ai)"}
+
+# Persistent cache of Wikipedia search results
+DEFAULT_PAGE_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "wiki_cache.sqlite3"
+)
+PAGE_CACHE_TTL = 7 * 24 * 3600
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# The semantic cache only saves work if its embedding lookup is quick
+SEMANTIC_LOOKUP_TIMEOUT = 2.0
+
+# Embedding vectors shared by all retrievers, keyed by model and text
+_EMBEDDING_CACHE = LRUCache(maxsize=4096)
+
+# One event loop thread (started lazily) shared by all retrievers; it owns the
+# pooled HTTP client and the rate limiter, so evicted retrievers leak nothing
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+_HTTP: Optional[httpx.AsyncClient] = None
+_LIMITER: Optional[AsyncLimiter] = None
+
+
+def _run(coro):
+    """Run a coroutine on the shared retrieval loop and wait for its result."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name="truthlens-retrieval", daemon=True).start()
+        loop = _LOOP
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def shutdown() -> None:
+    """Close the shared HTTP client and stop the retrieval loop (it restarts on next use)."""
+    global _LOOP, _HTTP, _LIMITER
+    with _LOOP_LOCK:
+        loop, _LOOP = _LOOP, None
+    if loop is None:
+        return
+    
+    if _HTTP is not None:
+        asyncio.run_coroutine_threadsafe(_HTTP.aclose(), loop).result()
+    _HTTP = _LIMITER = None
+    loop.call_soon_threadsafe(loop.stop)
+
+
+async def _get_http() -> httpx.AsyncClient:
+    """
+    Return the shared keep-alive client (only ever called on the retrieval
+    loop). HTTP/2 lets concurrent requests share one connection per host.
+    """
+    global _HTTP
+    if _HTTP is None or _HTTP.is_closed:
+        _HTTP = httpx.AsyncClient(
+            http2=True,
+            headers=HTTP_HEADERS,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+    return _HTTP
+
+
+def _get_limiter() -> AsyncLimiter:
+    """Return the shared token bucket (created on the retrieval loop, which it belongs to)."""
+    global _LIMITER
+    if _LIMITER is None:
+        _LIMITER = AsyncLimiter(WIKIPEDIA_MAX_RATE, WIKIPEDIA_RATE_PERIOD)
+    return _LIMITER
+
+
+def _first_n_sentences(text: str, n: int) -> str:
+    """Return text up to and including its nth period, scanning no further."""
+    for count, match in enumerate(_PERIOD_RE.finditer(text), start=1):
+        if count == n:
+            return text[:match.end()]
+    return text
+
+
+def _is_rate_limited(error: BaseException) -> bool:
+    """Whether an HTTP call was rejected with 429 Too Many Requests."""
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429
+
+
+_rate_limit_backoff = wait_exponential_jitter(multiplier=0.5, max=8)
+
+
+def _wait_retry_after(retry_state: RetryCallState) -> float:
+    """Wait as long as the server's Retry-After asks, else back off exponentially."""
+    error = retry_state.outcome.exception()
+    try:
+        return min(float(error.response.headers["Retry-After"]), 30.0)
+    except (AttributeError, KeyError, ValueError):
+        # Missing, or an HTTP date rather than a number of seconds
+        return _rate_limit_backoff(retry_state)
+
+
+def _is_transient_openai_error(error: BaseException) -> bool:
+    """Whether an embeddings call failed on a rate limit or connection error."""
+    # Imported here: the openai SDK is only loaded by methods that need embeddings
+    from openai import APIConnectionError, RateLimitError
+    return isinstance(error, (RateLimitError, APIConnectionError))
 
 
 class EvidenceRetriever:
     """Retrieves evidence from various sources to fact-check claims."""
     
-    def __init__(self, retrieval_method: str = "wikipedia", openai_api_key: Optional[str] = None):
+    def __init__(
+        self,
+        retrieval_method: str = "wikipedia",
+        openai_api_key: Optional[str] = None,
+        page_cache_path: Optional[str] = None,
+        semantic_cache_threshold: Optional[float] = 0.92
+    ):
         """
         Initialize evidence retriever.
         
         Args:
             retrieval_method: "wikipedia", "web", or "vector"
             openai_api_key: OpenAI API key for embeddings (if using vector search)
+            page_cache_path: SQLite file for cached Wikipedia results (defaults to data/)
+            semantic_cache_threshold: Cosine similarity at which a paraphrased claim
+                reuses earlier evidence (None disables; needs an embeddings client)
         """
         self.method = retrieval_method.lower()
+        self.language = "en"
         self.openai_client = None
+        # Evidence for recently seen claims, so prefetched results can be reused
+        self._evidence_cache = LRUCache(maxsize=1024, ttl=3600)
+        self._page_cache = DiskCache(page_cache_path or DEFAULT_PAGE_CACHE_PATH, ttl=PAGE_CACHE_TTL)
         
         if self.method == "vector" or self.method == "web":
             api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
             if api_key:
-                self.openai_client = OpenAI(api_key=api_key)
+                from openai import OpenAI
+                # Retries are handled (once) by _create_embeddings
+                self.openai_client = OpenAI(api_key=api_key, max_retries=0)
         
-        # Configure Wikipedia
-        if self.method == "wikipedia":
-            wikipedia.set_lang("en")
-            wikipedia.set_rate_limiting(True)
+        self._semantic_cache = None
+        if self.openai_client and semantic_cache_threshold is not None:
+            self._semantic_cache = SemanticCache(threshold=semantic_cache_threshold, maxsize=1024, ttl=3600)
     
     def retrieve(self, claim: str, top_k: int = 5) -> List[Dict[str, str]]:
         """
@@ -44,39 +185,193 @@ class EvidenceRetriever:
         Returns:
             List of evidence dictionaries with 'text' and 'source' keys
         """
+        return self.retrieve_many([claim], top_k)[0]
+    
+    async def retrieve_async(self, claim: str, top_k: int = 5) -> List[Dict[str, str]]:
+        """
+        Async variant of retrieve().
+        
+        Args:
+            claim: The claim to fact-check
+            top_k: Number of evidence snippets to return
+            
+        Returns:
+            List of evidence dictionaries with 'text' and 'source' keys
+        """
+        return await asyncio.to_thread(self.retrieve, claim, top_k)
+    
+    def retrieve_many(self, claims: List[str], top_k: int = 5) -> List[List[Dict[str, str]]]:
+        """
+        Retrieve evidence for several claims concurrently.
+        
+        Identical claims are looked up once. Cached evidence is resolved on the
+        calling thread; only the remaining claims go to the retrieval loop,
+        where their lookups run together.
+        
+        Args:
+            claims: The claims to fact-check
+            top_k: Number of evidence snippets to return per claim
+            
+        Returns:
+            One evidence list per claim, in input order
+        """
+        found = {}
+        for claim in dict.fromkeys(claims):
+            cached = self._evidence_cache.get(content_key(self.method, claim, top_k))
+            if cached is not None:
+                found[claim] = cached
+        
+        missing = [claim for claim in dict.fromkeys(claims) if claim not in found]
+        similar, vectors = self._find_similar(missing, top_k)
+        found.update(similar)
+        
+        pending = [claim for claim in missing if claim not in similar]
+        if pending:
+            for claim, evidence in zip(pending, _run(self._gather_sources(pending, top_k))):
+                found[claim] = evidence
+                self._store(claim, top_k, evidence, vectors.get(claim))
+        
+        return [list(found[claim]) for claim in claims]
+    
+    async def retrieve_many_async(self, claims: List[str], top_k: int = 5) -> List[List[Dict[str, str]]]:
+        """
+        Async variant of retrieve_many().
+        
+        Args:
+            claims: The claims to fact-check
+            top_k: Number of evidence snippets to return per claim
+            
+        Returns:
+            One evidence list per claim, in input order
+        """
+        return await asyncio.to_thread(self.retrieve_many, claims, top_k)
+    
+    def _find_similar(
+        self,
+        claims: List[str],
+        top_k: int
+    ) -> Tuple[Dict[str, List[Dict[str, str]]], Dict[str, np.ndarray]]:
+        """
+        Reuse evidence stored for paraphrases of the claims (one embeddings request).
+        
+        Returns:
+            Evidence per claim with a close enough match, and each claim's vector
+            (empty when the semantic cache is off or the lookup failed)
+        """
+        if self._semantic_cache is None or not claims:
+            return {}, {}
+        
+        try:
+            matrix = self.get_embeddings_batch(claims, timeout=SEMANTIC_LOOKUP_TIMEOUT)
+        except Exception as e:
+            print(f"Semantic cache error: {e}")
+            return {}, {}
+        
+        vectors = dict(zip(claims, matrix))
+        similar = {}
+        for claim, vector in vectors.items():
+            match = self._semantic_cache.get(vector)
+            if match is not None and match["top_k"] >= top_k:
+                similar[claim] = match["evidence"][:top_k]
+        return similar, vectors
+    
+    def _store(self, claim: str, top_k: int, evidence: List[Dict[str, str]], vector: Optional[np.ndarray]) -> None:
+        """Cache freshly retrieved evidence for a claim."""
+        # Empty results may be transient lookup failures, so only cache hits
+        if not evidence:
+            return
+        self._evidence_cache.set(content_key(self.method, claim, top_k), list(evidence))
+        if vector is not None:
+            self._semantic_cache.set(vector, {"top_k": top_k, "evidence": list(evidence)})
+    
+    async def _gather_sources(self, claims: List[str], top_k: int) -> List[List[Dict[str, str]]]:
+        """
+        Look up claims concurrently (called on the retrieval loop). Everything
+        here is async, so no loop or executor thread ever blocks waiting on
+        another lookup.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_RETRIEVALS)
+        
+        async def bounded(claim: str) -> List[Dict[str, str]]:
+            async with semaphore:
+                return await self._retrieve_from_source(claim, top_k)
+        
+        return await asyncio.gather(*(bounded(claim) for claim in claims))
+    
+    async def _retrieve_from_source(self, claim: str, top_k: int) -> List[Dict[str, str]]:
+        """Retrieve evidence for one claim with the configured method."""
         if self.method == "wikipedia":
-            return self._retrieve_wikipedia(claim, top_k)
+            return await self._retrieve_wikipedia_async(claim, top_k)
         elif self.method == "web":
-            return self._retrieve_web(claim, top_k)
+            return await self._retrieve_web_async(claim, top_k)
         elif self.method == "vector":
-            return self._retrieve_vector(claim, top_k)
+            return await self._retrieve_vector_async(claim, top_k)
         else:
             raise ValueError(f"Unknown retrieval method: {self.method}")
     
-    def _retrieve_wikipedia(self, claim: str, top_k: int) -> List[Dict[str, str]]:
-        """Retrieve evidence from Wikipedia."""
+    @retry(
+        retry=retry_if_exception(_is_rate_limited),
+        stop=stop_after_attempt(4),
+        wait=_wait_retry_after,
+        reraise=True
+    )
+    async def _query_wikipedia(self, params: Dict) -> Dict:
+        """Make one rate-limited MediaWiki API call, retrying when throttled."""
+        client = await _get_http()
+        async with _get_limiter():
+            response = await client.get(WIKIPEDIA_API_URL.format(lang=self.language), params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    async def _retrieve_wikipedia_async(self, claim: str, top_k: int) -> List[Dict[str, str]]:
+        """
+        Retrieve evidence from Wikipedia with a single API call: the search
+        hits and the plain-text intros (first EXTRACT_SENTENCES sentences) of their pages
+        come back together, with redirects followed server-side.
+        """
+        key = f"wikipedia-search:{self.language}:{top_k}:{claim}"
+        # sqlite may block (up to its lock timeout), so keep it off the shared loop
+        cached = await asyncio.to_thread(self._page_cache.get_many, [key])
+        if key in cached:
+            return cached[key]
+        
+        params = {
+            "action": "query",
+            "format": "json",
+            "generator": "search",
+            "gsrsearch": claim,
+            "gsrlimit": top_k,
+            "prop": "extracts|info|pageprops",
+            "exintro": 1,
+            "explaintext": 1,
+            "exsentences": EXTRACT_SENTENCES,
+            "exlimit": "max",
+            "redirects": 1,
+            "inprop": "url",
+            "ppprop": "disambiguation"
+        }
         evidence = []
         
         try:
-            # Search for relevant pages
-            search_results = wikipedia.search(claim, results=top_k)
+            data = await self._query_wikipedia(params)
             
-            for title in search_results[:top_k]:
-                try:
-                    page = wikipedia.page(title, auto_suggest=False)
-                    # Extract relevant sentences (simple approach)
-                    sentences = page.content.split('.')[:10]  # First 10 sentences
-                    text = '. '.join(sentences) + '.'
-                    
-                    evidence.append({
-                        "text": text,
-                        "source": f"Wikipedia: {title}",
-                        "url": page.url
-                    })
-                except wikipedia.exceptions.DisambiguationError:
-                    continue
-                except wikipedia.exceptions.PageError:
+            # Pages come back keyed by page id; "index" is the search rank
+            pages = sorted(
+                data.get("query", {}).get("pages", {}).values(),
+                key=lambda page: page.get("index", 0)
+            )
+            for page in pages:
+                if "missing" in page or "disambiguation" in page.get("pageprops", {}):
                     continue
+                
+                evidence.append({
+                    # exsentences is best-effort server-side, so enforce the bound here
+                    "text": _first_n_sentences(page.get("extract", ""), EXTRACT_SENTENCES),
+                    "source": f"Wikipedia: {page['title']}",
+                    "url": page["fullurl"]
+                })
+            
+            await asyncio.to_thread(self._page_cache.set_many, {key: evidence[:top_k]})
                     
         except Exception as e:
             # Fallback: return empty evidence
@@ -84,26 +379,90 @@ class EvidenceRetriever:
         
         return evidence[:top_k]
     
-    def _retrieve_web(self, claim: str, top_k: int) -> List[Dict[str, str]]:
+    async def _retrieve_web_async(self, claim: str, top_k: int) -> List[Dict[str, str]]:
         """Retrieve evidence using web search (requires API key)."""
         # This is a placeholder - in production, use Google/Bing API
         # For hackathon, we'll use a simple Wikipedia fallback
-        return self._retrieve_wikipedia(claim, top_k)
+        return await self._retrieve_wikipedia_async(claim, top_k)
     
-    def _retrieve_vector(self, claim: str, top_k: int) -> List[Dict[str, str]]:
+    async def _retrieve_vector_async(self, claim: str, top_k: int) -> List[Dict[str, str]]:
         """Retrieve evidence using vector similarity (placeholder)."""
         # In production, this would search a FAISS/Pinecone database
         # For now, fallback to Wikipedia
-        return self._retrieve_wikipedia(claim, top_k)
+        return await self._retrieve_wikipedia_async(claim, top_k)
+    
+    def get_embeddings(self, text: Union[str, List[str]]) -> np.ndarray:
+        """
+        Get embeddings for text using OpenAI.
+        
+        Args:
+            text: A single string, or a list of strings to embed in one request
+            
+        Returns:
+            The float32 unit vector for a single string, or a (len(text), dim)
+            array of them for a list
+        """
+        if isinstance(text, str):
+            return self.get_embeddings_batch([text])[0]
+        return self.get_embeddings_batch(text)
     
-    def get_embeddings(self, text: str) -> List[float]:
-        """Get embeddings for text using OpenAI."""
+    def get_embeddings_batch(self, texts: List[str], timeout: Optional[float] = None) -> np.ndarray:
+        """
+        Get embeddings for many texts with at most one API request.
+        
+        Cached vectors are reused; only the remaining texts are sent, together.
+        Vectors are L2-normalized, so cosine similarity is a plain dot product.
+        
+        Args:
+            texts: Strings to embed
+            timeout: Seconds to wait for a single, unretried request (None
+                retries transient failures with backoff)
+            
+        Returns:
+            float32 array of shape (len(texts), dim), rows in input order
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
         if not self.openai_client:
             raise ValueError("OpenAI client not initialized")
         
-        response = self.openai_client.embeddings.create(
-            model="text-embedding-3-small",
-            input=text
+        keys = [content_key(EMBEDDING_MODEL, t) for t in texts]
+        vectors = {key: _EMBEDDING_CACHE.get(key) for key in keys}
+        missing = {key: t for key, t in zip(keys, texts) if vectors[key] is None}
+        
+        if missing:
+            if timeout is None:
+                response = self._create_embeddings(list(missing.values()))
+            else:
+                response = self._request_embeddings(list(missing.values()), timeout=timeout)
+            # Raw little-endian float32 bytes, far cheaper to decode than float lists
+            fresh = np.vstack([
+                np.frombuffer(base64.b64decode(item.embedding), dtype=np.float32)
+                for item in response.data
+            ])
+            norms = np.linalg.norm(fresh, axis=1, keepdims=True)
+            fresh = np.divide(fresh, norms, out=np.zeros_like(fresh), where=norms > 0)
+            for key, vector in zip(missing, fresh):
+                vectors[key] = vector
+                _EMBEDDING_CACHE.set(key, vector)
+        
+        return np.vstack([vectors[key] for key in keys])
+    
+    @retry(
+        retry=retry_if_exception(_is_transient_openai_error),
+        stop=stop_after_attempt(5),
+        wait=wait_exponential_jitter(multiplier=0.5, max=8),
+        reraise=True
+    )
+    def _create_embeddings(self, texts: List[str]):
+        """Call the embeddings API, backing off on rate limits and connection errors."""
+        return self._request_embeddings(texts)
+    
+    def _request_embeddings(self, texts: List[str], **options):
+        """Make a single embeddings API call (the client itself never retries)."""
+        return self.openai_client.embeddings.create(
+            model=EMBEDDING_MODEL,
+            input=texts,
+            encoding_format="base64",
+            **options
         )
-        return response.data[0].embedding
-
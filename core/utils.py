@@ -1,7 +1,46 @@
 """
 Utility functions for the hallucination meter.
 """
-from typing import Dict, List
+from typing import Dict, List, Sequence, Union
+import numpy as np
+
+
+# (minimum percentage, emoji, label), highest band first
+_SCORE_BANDS = (
+    (75, "✅", "Highly Truthful"),
+    (55, "⚠️", "Mostly Truthful"),
+    (35, "❓", "Uncertain"),
+)
+_LOWEST_BAND = ("❌", "Likely Hallucination")
+
+# The same bands in ascending order, for vectorized lookup
+_BAND_EDGES = np.array([minimum for minimum, _, _ in reversed(_SCORE_BANDS)], dtype=float)
+_BAND_LABELS = np.array(
+    [" ".join(_LOWEST_BAND)] + [f"{emoji} {label}" for _, emoji, label in reversed(_SCORE_BANDS)]
+)
+
+_VERDICT_MAP: Dict[str, str] = {
+    "highly_truthful": "✅ Highly Truthful",
+    "mostly_truthful": "⚠️ Mostly Truthful",
+    "uncertain": "❓ Uncertain",
+    "likely_hallucination": "❌ Likely Hallucination",
+    "supported": "✅ Supported",
+    "weak_support": "⚠️ Weak Support",
+    "contradicted": "❌ Contradicted",
+    "no_evidence": "❓ No Evidence",
+    "no_claims": "❓ No Claims",
+    "error": "❌ Error"
+}
+
+# UI colour per verdict; anything unlisted (contradictions, errors, ...) is red
+_VERDICT_COLOR: Dict[str, str] = {
+    "highly_truthful": "green",
+    "mostly_truthful": "green",
+    "supported": "green",
+    "uncertain": "orange",
+    "weak_support": "orange",
+    "no_evidence": "orange"
+}
 
 
 def format_score_display(score: float) -> str:
@@ -15,23 +54,34 @@ def format_score_display(score: float) -> str:
         Formatted string
     """
     percentage = score * 100
-    
-    if percentage >= 75:
-        emoji = "✅"
-        label = "Highly Truthful"
-    elif percentage >= 55:
-        emoji = "⚠️"
-        label = "Mostly Truthful"
-    elif percentage >= 35:
-        emoji = "❓"
-        label = "Uncertain"
-    else:
-        emoji = "❌"
-        label = "Likely Hallucination"
+    emoji, label = next(
+        ((emoji, label) for minimum, emoji, label in _SCORE_BANDS if percentage >= minimum),
+        _LOWEST_BAND
+    )
     
     return f"{emoji} {label} ({percentage:.1f}%)"
 
 
+def format_scores_display(scores: Union[Sequence[float], np.ndarray]) -> List[str]:
+    """
+    Format many scores for display at once (same output as format_score_display).
+    
+    Args:
+        scores: Scores from 0.0 to 1.0
+        
+    Returns:
+        Formatted strings, in input order
+    """
+    percentages = np.asarray(scores, dtype=float) * 100
+    bands = np.searchsorted(_BAND_EDGES, percentages, side="right")
+    bands[np.isnan(percentages)] = 0
+    
+    return [
+        f"{label} ({percentage:.1f}%)"
+        for label, percentage in zip(_BAND_LABELS[bands], percentages)
+    ]
+
+
 def format_verdict(verdict: str) -> str:
     """
     Format verdict for display.
@@ -42,20 +92,7 @@ def format_verdict(verdict: str) -> str:
     Returns:
         Human-readable verdict
     """
-    verdict_map = {
-        "highly_truthful": "✅ Highly Truthful",
-        "mostly_truthful": "⚠️ Mostly Truthful",
-        "uncertain": "❓ Uncertain",
-        "likely_hallucination": "❌ Likely Hallucination",
-        "supported": "✅ Supported",
-        "weak_support": "⚠️ Weak Support",
-        "contradicted": "❌ Contradicted",
-        "no_evidence": "❓ No Evidence",
-        "no_claims": "❓ No Claims",
-        "error": "❌ Error"
-    }
-    
-    return verdict_map.get(verdict, verdict)
+    return _VERDICT_MAP.get(verdict, verdict)
 
 
 def get_verdict_color(verdict: str) -> str:
@@ -68,10 +105,5 @@ def get_verdict_color(verdict: str) -> str:
     Returns:
         Color name
     """
-    if "truthful" in verdict or "supported" in verdict:
-        return "green"
-    elif "uncertain" in verdict or "weak" in verdict or "no_evidence" in verdict:
-        return "orange"
-    else:
-        return "red"
+    return _VERDICT_COLOR.get(verdict, "red")
 
@@ -5,13 +5,18 @@ Run this to start the Streamlit UI.
 import sys
 import os
 
-# Add the project root to the path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-if __name__ == "__main__":
+def main():
+    """Launch the Streamlit UI."""
     import streamlit.web.cli as stcli
     
+    # Add the project root to the path
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    
     # Run Streamlit
     sys.argv = ["streamlit", "run", "app/ui.py"]
     sys.exit(stcli.main())
 
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 Simple test script to verify the hallucination meter works.
 """
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from core.hallucination_meter import HallucinationMeter
 
 
@@ -30,49 +31,45 @@ def test_basic_evaluation():
         print(f"❌ Initialization failed: {e}")
         return
     
-    # Test 1: Evaluate a known fact
-    print("Test 1: Evaluating a factual statement...")
-    test_text = "The capital of France is Paris."
-    print(f"   Text: {test_text}")
+    # (label, input kind, input, call) for each check
+    tests = [
+        ("Test 1: Evaluating a factual statement...", "Text",
+         "The capital of France is Paris.", meter.evaluate),
+        ("Test 2: Evaluating a potentially false statement...", "Text",
+         "Beethoven met Mozart in Vienna in 1787 and they became best friends.", meter.evaluate),
+        ("Test 3: Query and evaluate...", "Query",
+         "What is the capital of France?", meter.evaluate_query),
+    ]
     
-    try:
-        result = meter.evaluate(test_text)
-        print(f"   ✅ Score: {result['percentage_score']:.1f}%")
-        print(f"   ✅ Verdict: {result['verdict']}")
-        print(f"   ✅ Claims analyzed: {result['total_claims']}")
-        print("")
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
-        print("")
-    
-    # Test 2: Evaluate a potentially false statement
-    print("Test 2: Evaluating a potentially false statement...")
-    test_text = "Beethoven met Mozart in Vienna in 1787 and they became best friends."
-    print(f"   Text: {test_text}")
-    
-    try:
-        result = meter.evaluate(test_text)
-        print(f"   ✅ Score: {result['percentage_score']:.1f}%")
-        print(f"   ✅ Verdict: {result['verdict']}")
-        print(f"   ✅ Claims analyzed: {result['total_claims']}")
-        print("")
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
-        print("")
+    # The checks are I/O-bound, so run them concurrently; each gets a
+    # pre-assigned slot so the report below stays in order
+    outcomes = [None] * len(tests)
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {
+            executor.submit(run, value): i
+            for i, (_, _, value, run) in enumerate(tests)
+        }
+        for future in as_completed(futures):
+            try:
+                outcomes[futures[future]] = (future.result(), None)
+            except Exception as e:
+                outcomes[futures[future]] = (None, e)
     
-    # Test 3: Query and evaluate
-    print("Test 3: Query and evaluate...")
-    query = "What is the capital of France?"
-    print(f"   Query: {query}")
-    
-    try:
-        result = meter.evaluate_query(query)
-        print(f"   ✅ Answer: {result.get('answer', 'N/A')[:100]}...")
+    for (label, kind, value, _), (result, error) in zip(tests, outcomes):
+        print(label)
+        print(f"   {kind}: {value}")
+        
+        if error is not None:
+            print(f"   ❌ Error: {error}")
+            print("")
+            continue
+        
+        if kind == "Query":
+            print(f"   ✅ Answer: {result.get('answer', 'N/A')[:100]}...")
         print(f"   ✅ Score: {result['percentage_score']:.1f}%")
         print(f"   ✅ Verdict: {result['verdict']}")
-        print("")
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
+        if kind == "Text":
+            print(f"   ✅ Claims analyzed: {result['total_claims']}")
         print("")
     
     print("🎉 Tests completed!")
@@ -0,0 +1,79 @@
+"""
+Tests for the FastAPI app's lifespan, thread pool and meter reuse (no network access).
+"""
+import asyncio
+import threading
+import pytest
+from fastapi.testclient import TestClient
+import app.api as api
+
+
+class FakeLLM:
+    def __init__(self):
+        self.warmed = []
+    
+    def generate(self, prompt, system_prompt=None):
+        self.warmed.append("sync")
+        return "ok"
+    
+    async def generate_async(self, prompt, system_prompt=None):
+        self.warmed.append("async")
+        return "ok"
+
+
+class FakeMeter:
+    """Reports which thread each evaluation ran on."""
+    
+    def __init__(self):
+        self.llm = FakeLLM()
+    
+    def evaluate(self, text):
+        return {"thread": threading.current_thread().name}
+    
+    async def evaluate_query_async(self, query):
+        return {"thread": await asyncio.to_thread(lambda: threading.current_thread().name)}
+
+
+@pytest.fixture
+def meters(monkeypatch):
+    """Replace meter construction with fakes, recording the settings requested."""
+    built = {}
+    
+    def get_meter(*settings):
+        return built.setdefault(settings, FakeMeter())
+    
+    monkeypatch.setattr(api, "_get_meter", get_meter)
+    monkeypatch.setattr(api, "shutdown_retrieval", lambda: built.setdefault("shutdown", True))
+    return built
+
+
+def test_lifespan_warms_up_and_shuts_down(meters):
+    with TestClient(api.app):
+        assert meters[("openai", "wikipedia", True)].llm.warmed == ["sync", "async"]
+        assert "shutdown" not in meters
+    assert meters["shutdown"] is True
+
+
+def test_both_endpoints_run_on_the_api_pool(meters):
+    with TestClient(api.app) as client:
+        check = client.post("/check", json={"text": "x"}).json()
+        query = client.post("/query", json={"query": "x"}).json()
+    
+    assert check["result"]["thread"].startswith("truthlens-api")
+    assert query["result"]["thread"].startswith("truthlens-api")
+
+
+def test_app_can_start_twice_in_one_process(meters):
+    for _ in range(2):
+        with TestClient(api.app) as client:
+            response = client.post("/query", json={"query": "x"})
+            assert response.status_code == 200
+            assert response.json()["success"] is True
+
+
+def test_meter_settings_are_normalized(meters):
+    with TestClient(api.app) as client:
+        for provider in ("OpenAI", "openai"):
+            client.post("/check", json={"text": "x", "llm_provider": provider, "retrieval_method": "Wikipedia"})
+    
+    assert [key for key in meters if key != "shutdown"] == [("openai", "wikipedia", True)]
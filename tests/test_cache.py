@@ -0,0 +1,109 @@
+"""
+Tests for the in-process and on-disk caches.
+"""
+import sqlite3
+from types import SimpleNamespace
+import numpy as np
+import pytest
+import core.cache as cache_module
+from core.cache import DiskCache, LRUCache, SemanticCache, content_key
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for the cache module's time source."""
+    now = SimpleNamespace(value=1000.0)
+    fake_time = SimpleNamespace(monotonic=lambda: now.value, time=lambda: now.value)
+    monkeypatch.setattr(cache_module, "time", fake_time)
+    return now
+
+
+def test_content_key_is_stable_and_distinct():
+    assert content_key("a", {"x": 1, "y": 2}) == content_key("a", {"y": 2, "x": 1})
+    assert content_key("a", "b") != content_key("ab")
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_entries_expire_after_ttl(clock):
+    cache = LRUCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+    
+    clock.value += 9.9
+    assert cache.get("a") == 1
+    clock.value += 0.2
+    assert cache.get("a", "missing") == "missing"
+    assert len(cache) == 0
+
+
+def test_semantic_cache_hits_above_threshold_only():
+    cache = SemanticCache(threshold=0.9)
+    cache.set(np.array([1.0, 0.0]), "x")
+    
+    assert cache.get(np.array([10.0, 1.0])) == "x"  # cos ~ 0.995
+    assert cache.get(np.array([1.0, 1.0])) is None  # cos ~ 0.707
+    assert cache.get(np.array([0.0, 0.0])) is None
+
+
+def test_semantic_cache_returns_nearest_and_trims_oldest():
+    cache = SemanticCache(threshold=0.5, maxsize=2)
+    cache.set(np.array([1.0, 0.0]), "x")
+    cache.set(np.array([0.0, 1.0]), "y")
+    cache.set(np.array([1.0, 1.0]), "z")
+    
+    assert len(cache) == 2
+    assert cache.get(np.array([0.1, 1.0])) == "y"
+    assert cache.get(np.array([1.0, 0.0])) == "z"  # "x" was evicted
+
+
+def test_semantic_cache_skips_expired_entries(clock):
+    cache = SemanticCache(threshold=0.9, ttl=5)
+    cache.set(np.array([1.0, 0.0]), "old")
+    clock.value += 6
+    cache.set(np.array([0.0, 1.0]), "new")
+    
+    assert cache.get(np.array([1.0, 0.0])) is None
+    assert cache.get(np.array([0.0, 1.0])) == "new"
+
+
+def test_disk_cache_round_trip_and_ttl(tmp_path, clock):
+    path = str(tmp_path / "nested" / "cache.sqlite3")
+    cache = DiskCache(path, ttl=60)
+    cache.set_many({"a": [{"text": "é"}], "b": None})
+    
+    assert DiskCache(path, ttl=60).get_many(["a", "b", "c"]) == {"a": [{"text": "é"}], "b": None}
+    clock.value += 61
+    assert cache.get_many(["a", "b"]) == {}
+
+
+def test_disk_cache_prunes_expired_rows_on_write(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = DiskCache(path, ttl=60)
+    cache.set_many({"old": 1})
+    clock.value += 61
+    cache.set_many({"new": 2})
+    
+    with sqlite3.connect(path) as conn:
+        keys = [key for key, in conn.execute("SELECT key FROM cache")]
+    assert keys == ["new"]
+
+
+def test_disk_cache_degrades_to_miss_on_storage_errors(tmp_path, capsys):
+    path = tmp_path / "broken.sqlite3"
+    path.write_bytes(b"this is not a database" * 100)
+    cache = DiskCache(str(path), ttl=60)
+    
+    cache.set_many({"a": 1})
+    assert cache.get_many(["a"]) == {}
+    assert "Disk cache error" in capsys.readouterr().out
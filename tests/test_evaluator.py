@@ -0,0 +1,112 @@
+"""
+Tests for the evaluator's verdict ladders and LLM fallback (fake LLM and retriever, no network access).
+"""
+import asyncio
+import numpy as np
+import pytest
+from core.evaluator import TruthfulnessEvaluator
+
+
+EVIDENCE = [{"text": "Paris is in France.", "source": "Wikipedia: Paris", "url": "u"}]
+
+
+class FakeRetriever:
+    """Embeds the claim as [1, 0] and each evidence snippet at the given cosine similarity."""
+    
+    def __init__(self, similarity=0.9):
+        self.similarity = similarity
+    
+    def get_embeddings_batch(self, texts, timeout=None):
+        evidence = [self.similarity, np.sqrt(1.0 - self.similarity ** 2)]
+        return np.array([[1.0, 0.0]] + [evidence] * (len(texts) - 1), dtype=np.float32)
+
+
+class FakeLLM:
+    """Answers every verification with the same response (or raises it)."""
+    
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+    
+    def generate(self, prompt, **kwargs):
+        self.calls += 1
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+    
+    async def generate_async(self, prompt, **kwargs):
+        return self.generate(prompt, **kwargs)
+
+
+@pytest.mark.parametrize("similarity, verdict", [
+    (0.30, "contradicted"),
+    (0.40, "weak_support"),
+    (0.60, "uncertain"),
+    (0.80, "supported"),
+])
+def test_embedding_verdict_ladder(similarity, verdict):
+    evaluator = TruthfulnessEvaluator(FakeRetriever(similarity))
+    
+    result = evaluator.evaluate_claim("Paris is in France", EVIDENCE)
+    
+    assert result["score"] == pytest.approx(similarity, abs=1e-6)
+    assert result["verdict"] == verdict
+
+
+@pytest.mark.parametrize("score, verdict", [
+    (0.0, "likely_hallucination"),
+    (0.34, "likely_hallucination"),
+    (0.35, "uncertain"),
+    (0.55, "mostly_truthful"),
+    (0.75, "highly_truthful"),
+    (1.0, "highly_truthful"),
+])
+def test_overall_verdict_ladder(score, verdict):
+    evaluator = TruthfulnessEvaluator(FakeRetriever())
+    
+    result = evaluator._aggregate([{"claim": "c", "context": ""}], [{"score": score}])
+    
+    assert result["overall_score"] == score
+    assert result["verdict"] == verdict
+
+
+def test_unparseable_llm_answer_falls_back_to_embeddings():
+    llm = FakeLLM("not json")
+    evaluator = TruthfulnessEvaluator(FakeRetriever(0.8), llm)
+    
+    result = evaluator.evaluate_claim("Paris is in France", EVIDENCE)
+    
+    assert result["verdict"] == "supported"
+    assert result["reasoning"].startswith("Embedding similarity")
+
+
+def test_non_object_llm_answer_falls_back_to_embeddings():
+    evaluator = TruthfulnessEvaluator(FakeRetriever(0.8), FakeLLM("[1, 2]"))
+    
+    assert evaluator.evaluate_claim("Paris is in France", EVIDENCE)["verdict"] == "supported"
+
+
+def test_llm_failure_is_reported_without_retrying():
+    llm = FakeLLM(RuntimeError("rate limited"))
+    evaluator = TruthfulnessEvaluator(FakeRetriever(0.8), llm)
+    
+    result = evaluator.evaluate_claim("Paris is in France", EVIDENCE)
+    
+    assert result["verdict"] == "error"
+    assert llm.calls == 1
+
+
+def test_async_paths_match_sync():
+    failing = FakeLLM(RuntimeError("rate limited"))
+    evaluator = TruthfulnessEvaluator(FakeRetriever(0.8), failing)
+    claims = [{"claim": "Paris is in France", "context": ""}]
+    
+    result = asyncio.run(evaluator.evaluate_text_async(claims, [EVIDENCE]))
+    
+    assert result["claim_results"][0]["verdict"] == "error"
+    assert failing.calls == 1
+    
+    evaluator.llm = FakeLLM("not json")
+    result = asyncio.run(evaluator.evaluate_text_async(claims, [EVIDENCE]))
+    
+    assert result["claim_results"][0]["verdict"] == "supported"
@@ -0,0 +1,89 @@
+"""
+Tests for claim extraction, streamed and non-streamed.
+"""
+import pytest
+from core.fact_extract import ClaimExtractor, _iter_array_items
+
+
+class FakeLLM:
+    """Returns a fixed response, streamed in chunks of the given size."""
+    
+    def __init__(self, response: str, chunk_size: int = 3):
+        self.response = response
+        self.chunk_size = chunk_size
+    
+    def generate(self, prompt, **kwargs):
+        return self.response
+    
+    def generate_stream(self, prompt, **kwargs):
+        for i in range(0, len(self.response), self.chunk_size):
+            yield self.response[i:i + self.chunk_size]
+
+
+def chunked(text: str, size: int):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 1000])
+def test_iter_array_items_handles_any_chunking(size):
+    text = '{"claims": [{"claim": "a", "context": "x"}, {"claim": "b, [c]", "context": ""}]}'
+    raw = []
+    
+    items = list(_iter_array_items(chunked(text, size), raw))
+    
+    assert items == [{"claim": "a", "context": "x"}, {"claim": "b, [c]", "context": ""}]
+    assert "".join(raw) == text
+
+
+@pytest.mark.parametrize("text", [
+    '{"note": "[x]", "claims": [{"claim": "z"}]}',
+    '{"note": "say \\"[\\" \\\\", "claims": [{"claim": "z"}]}',
+    '{"sources": ["a"], "claims": [{"claim": "z"}]}',
+    '{"meta": {"claims": [1]}, "claims": [{"claim": "z"}]}',
+])
+def test_iter_array_items_finds_the_claims_array(text):
+    assert list(_iter_array_items(chunked(text, 4), [])) == [{"claim": "z"}]
+
+
+def test_iter_array_items_accepts_bare_array():
+    assert list(_iter_array_items(chunked(' [{"claim": "a"}, 1]', 2), [])) == [{"claim": "a"}, 1]
+
+
+@pytest.mark.parametrize("text", ['{"claims": []}', "[]", '{"claims": [ ]}'])
+def test_iter_array_items_empty_array(text):
+    assert list(_iter_array_items(chunked(text, 2), [])) == []
+
+
+@pytest.mark.parametrize("response", [
+    '{"claims": [{"claim": "Paris is in France", "context": "geo"}]}',
+    '{"note": "[x]", "claims": [{"claim": "z", "context": ""}]}',
+    '{"meta": {"claims": [{"claim": "nested"}]}, "claims": [{"claim": "top"}]}',
+    '[{"claim": "bare"}, {"context": "no claim"}]',
+    '{"claims": []}',
+])
+def test_stream_matches_non_stream(response):
+    extractor = ClaimExtractor(FakeLLM(response))
+    
+    assert list(extractor.extract_claims_stream("text")) == extractor.extract_claims("text")
+
+
+def test_stream_falls_back_on_invalid_json():
+    extractor = ClaimExtractor(FakeLLM("not json"))
+    text = "Beethoven was born in 1770. He moved."
+    
+    assert list(extractor.extract_claims_stream(text)) == [
+        {"claim": "Beethoven was born in 1770", "context": "Extracted from text"}
+    ]
+
+
+def test_on_error_reports_fallback_only():
+    calls = []
+    failing = ClaimExtractor(FakeLLM("not json"))
+    working = ClaimExtractor(FakeLLM('{"claims": []}'))
+    
+    failing.extract_claims("text", on_error=lambda: calls.append("sync"))
+    list(failing.extract_claims_stream("text", on_error=lambda: calls.append("stream")))
+    working.extract_claims("text", on_error=lambda: calls.append("unexpected"))
+    list(working.extract_claims_stream("text", on_error=lambda: calls.append("unexpected")))
+    
+    assert calls == ["sync", "stream"]
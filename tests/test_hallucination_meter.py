@@ -0,0 +1,133 @@
+"""
+Tests for the meter's result cache (fake LLM and retriever, no network access).
+"""
+import asyncio
+import orjson
+import pytest
+import core.hallucination_meter as hallucination_meter
+from core.hallucination_meter import HallucinationMeter
+
+
+class FakeLLM:
+    """Extracts the given claims (or fails) and supports every claim it verifies."""
+    
+    def __init__(self, claims=("Paris is in France",), fail_extraction=False, fail_verification=False):
+        self.claims = [{"claim": claim, "context": ""} for claim in claims]
+        self.fail_extraction = fail_extraction
+        self.fail_verification = fail_verification
+        self.extractions = 0
+    
+    def _extraction(self):
+        self.extractions += 1
+        if self.fail_extraction:
+            raise RuntimeError("rate limited")
+        return orjson.dumps({"claims": self.claims}).decode()
+    
+    def generate(self, prompt, **kwargs):
+        if "Extract all atomic factual claims" in prompt:
+            return self._extraction()
+        if self.fail_verification:
+            raise RuntimeError("rate limited")
+        return '{"supported": true, "confidence": 0.9, "reasoning": "", "contradiction": false}'
+    
+    async def generate_async(self, prompt, **kwargs):
+        return self.generate(prompt, **kwargs)
+    
+    def generate_stream(self, prompt, **kwargs):
+        yield self._extraction()
+    
+    def generate_answer(self, query):
+        return "Paris is the capital of France."
+    
+    async def generate_answer_async(self, query):
+        return self.generate_answer(query)
+
+
+class FakeRetriever:
+    def __init__(self, evidence=True):
+        self.evidence = [{"text": "Paris is in France.", "source": "Wikipedia: Paris", "url": "u"}] if evidence else []
+    
+    def retrieve(self, claim, top_k=5):
+        return list(self.evidence)
+    
+    async def retrieve_many_async(self, claims, top_k=5):
+        return [list(self.evidence) for _ in claims]
+
+
+@pytest.fixture
+def make_meter(monkeypatch):
+    def make(llm, retriever=None):
+        monkeypatch.setattr(hallucination_meter, "LLMWrapper", lambda provider: llm)
+        monkeypatch.setattr(hallucination_meter, "EvidenceRetriever", lambda retrieval_method: retriever or FakeRetriever())
+        return HallucinationMeter()
+    return make
+
+
+def evaluate_twice(meter, use_async):
+    if use_async:
+        return [asyncio.run(meter.evaluate_async("Paris text")) for _ in range(2)]
+    return [meter.evaluate("Paris text") for _ in range(2)]
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_results_are_cached(make_meter, use_async):
+    llm = FakeLLM()
+    first, second = evaluate_twice(make_meter(llm), use_async)
+    
+    assert first["verdict"] == second["verdict"] == "highly_truthful"
+    assert llm.extractions == 1
+
+
+def test_cached_results_are_copies(make_meter):
+    meter = make_meter(FakeLLM())
+    meter.evaluate("Paris text")["verdict"] = "tampered"
+    
+    assert meter.evaluate("Paris text")["verdict"] == "highly_truthful"
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_no_evidence_results_are_not_cached(make_meter, use_async):
+    llm = FakeLLM()
+    first, _ = evaluate_twice(make_meter(llm, FakeRetriever(evidence=False)), use_async)
+    
+    assert first["claim_results"][0]["verdict"] == "no_evidence"
+    assert llm.extractions == 2
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_error_results_are_not_cached(make_meter, use_async):
+    llm = FakeLLM(fail_verification=True)
+    first, _ = evaluate_twice(make_meter(llm), use_async)
+    
+    assert first["claim_results"][0]["verdict"] == "error"
+    assert llm.extractions == 2
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_failed_extraction_is_not_cached(make_meter, use_async):
+    llm = FakeLLM(fail_extraction=True)
+    first, second = evaluate_twice(make_meter(llm), use_async)
+    
+    assert first["verdict"] == second["verdict"] == "no_claims"
+    assert llm.extractions == 2
+
+
+def test_queries_with_failed_extraction_are_not_cached(make_meter):
+    llm = FakeLLM(fail_extraction=True)
+    meter = make_meter(llm)
+    
+    meter.evaluate_query("Where is Paris?")
+    meter.evaluate_query("Where is Paris?")
+    
+    assert llm.extractions == 2
+
+
+def test_queries_are_cached(make_meter):
+    llm = FakeLLM()
+    meter = make_meter(llm)
+    
+    first = meter.evaluate_query("Where is Paris?")
+    second = meter.evaluate_query("Where is Paris?")
+    
+    assert first["answer"] == second["answer"]
+    assert llm.extractions == 1
@@ -0,0 +1,114 @@
+"""
+Tests for evidence retrieval helpers (no network access).
+"""
+import os
+import threading
+from types import SimpleNamespace
+import httpx
+import orjson
+import pytest
+import core.retrieval as retrieval
+from core.retrieval import EvidenceRetriever, _first_n_sentences, _wait_retry_after
+
+
+@pytest.mark.parametrize("text, n, expected", [
+    ("A. B. C. D", 2, "A. B."),
+    ("A. B", 5, "A. B"),
+    ("No period", 1, "No period"),
+    ("", 3, ""),
+])
+def test_first_n_sentences(text, n, expected):
+    assert _first_n_sentences(text, n) == expected
+
+
+@pytest.fixture
+def retriever(tmp_path):
+    yield EvidenceRetriever("wikipedia", page_cache_path=str(tmp_path / "cache.sqlite3"))
+    retrieval.shutdown()
+
+
+def install_wikipedia(handler):
+    """Route the shared MediaWiki client through an in-process handler."""
+    async def install():
+        retrieval._HTTP = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    retrieval._run(install())
+
+
+def search_result(request):
+    """MediaWiki generator=search response with one page named after the query."""
+    query = request.url.params["gsrsearch"]
+    return httpx.Response(200, content=orjson.dumps({"query": {"pages": {
+        "1": {"title": query, "index": 1, "extract": f"About {query}.", "fullurl": f"u/{query}"}
+    }}}))
+
+
+def test_retrieve_many_looks_up_each_claim_once(retriever, monkeypatch):
+    calls = []
+    
+    async def fake_wikipedia(claim, top_k):
+        calls.append(claim)
+        return [{"text": claim.upper(), "source": "Wikipedia: X", "url": "u"}]
+    
+    monkeypatch.setattr(retriever, "_retrieve_wikipedia_async", fake_wikipedia)
+    results = retriever.retrieve_many(["a", "b", "a"], top_k=2)
+    
+    assert sorted(calls) == ["a", "b"]
+    assert [r[0]["text"] for r in results] == ["A", "B", "A"]
+    assert results[0] is not results[2]
+    assert retriever.retrieve_many([]) == []
+    
+    # Second round is served from the evidence cache
+    assert retriever.retrieve("b", top_k=2)[0]["text"] == "B"
+    assert len(calls) == 2
+
+
+def test_retrieve_many_with_more_claims_than_executor_workers(retriever):
+    # Regression: lookups used to block the retrieval loop's executor threads
+    # while waiting on disk-cache work queued to that same executor
+    install_wikipedia(search_result)
+    claims = [f"claim {i}" for i in range(3 * (os.cpu_count() or 1) + 40)]
+    results = {}
+    
+    worker = threading.Thread(target=lambda: results.update(out=retriever.retrieve_many(claims, top_k=1)), daemon=True)
+    worker.start()
+    worker.join(timeout=30)
+    
+    assert not worker.is_alive(), "retrieve_many deadlocked"
+    assert [r[0]["source"] for r in results["out"]] == [f"Wikipedia: {claim}" for claim in claims]
+
+
+def rate_limited(headers=None, attempt=1):
+    """Retry state for a call that failed with 429."""
+    response = httpx.Response(429, headers=headers, request=httpx.Request("GET", "https://example.org"))
+    error = httpx.HTTPStatusError("429", request=response.request, response=response)
+    return SimpleNamespace(outcome=SimpleNamespace(exception=lambda: error), attempt_number=attempt)
+
+
+def test_wait_honours_retry_after_seconds():
+    assert _wait_retry_after(rate_limited({"Retry-After": "3"})) == 3.0
+    assert _wait_retry_after(rate_limited({"Retry-After": "600"})) == 30.0
+
+
+@pytest.mark.parametrize("headers", [None, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}])
+def test_wait_falls_back_to_backoff(headers):
+    assert 0.5 <= _wait_retry_after(rate_limited(headers, attempt=1)) <= 1.5
+    assert 4.0 <= _wait_retry_after(rate_limited(headers, attempt=4)) <= 5.0
+
+
+def test_wikipedia_query_retries_after_429(retriever):
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, content=orjson.dumps({"query": {"pages": {
+            "2": {"title": "Second", "index": 2, "extract": "Two.", "fullurl": "u2"},
+            "1": {"title": "First", "index": 1, "extract": "One. More.", "fullurl": "u1"},
+            "3": {"title": "Dab", "index": 3, "extract": "", "fullurl": "u3",
+                  "pageprops": {"disambiguation": ""}},
+        }}}))
+    ]
+    install_wikipedia(lambda request: responses.pop(0))
+    
+    assert retriever.retrieve("claim", top_k=3) == [
+        {"text": "One. More.", "source": "Wikipedia: First", "url": "u1"},
+        {"text": "Two.", "source": "Wikipedia: Second", "url": "u2"}
+    ]
+    assert responses == []
@@ -0,0 +1,53 @@
+"""
+Tests for display helpers.
+"""
+import numpy as np
+import pytest
+from core.utils import format_score_display, format_scores_display, format_verdict, get_verdict_color
+
+
+@pytest.mark.parametrize("score, label", [
+    (0.0, "❌ Likely Hallucination"),
+    (0.3499, "❌ Likely Hallucination"),
+    (0.35, "❓ Uncertain"),
+    (0.55, "⚠️ Mostly Truthful"),
+    (0.7499, "⚠️ Mostly Truthful"),
+    (0.75, "✅ Highly Truthful"),
+    (1.0, "✅ Highly Truthful"),
+])
+def test_band_edges(score, label):
+    assert format_score_display(score) == f"{label} ({score * 100:.1f}%)"
+
+
+def test_batch_matches_scalar_formatting():
+    scores = [0.0, 0.2, 0.35, 0.5, 0.55, 0.6, 0.75, 0.99, 1.0]
+    
+    assert format_scores_display(scores) == [format_score_display(s) for s in scores]
+    assert format_scores_display(np.array(scores)) == format_scores_display(scores)
+    assert format_scores_display([]) == []
+
+
+def test_batch_maps_nan_to_lowest_band():
+    assert format_scores_display([float("nan")]) == ["❌ Likely Hallucination (nan%)"]
+
+
+def test_format_verdict_passes_unknown_through():
+    assert format_verdict("supported") == "✅ Supported"
+    assert format_verdict("something_new") == "something_new"
+
+
+@pytest.mark.parametrize("verdict, color", [
+    ("highly_truthful", "green"),
+    ("mostly_truthful", "green"),
+    ("supported", "green"),
+    ("uncertain", "orange"),
+    ("weak_support", "orange"),
+    ("no_evidence", "orange"),
+    ("likely_hallucination", "red"),
+    ("contradicted", "red"),
+    ("no_claims", "red"),
+    ("error", "red"),
+    ("something_new", "red"),
+])
+def test_verdict_colors(verdict, color):
+    assert get_verdict_color(verdict) == color